@@ -2,77 +2,110 @@
 
 from __future__ import annotations
 
+import json
 from pathlib import Path
 
-import altair as alt
+import duckdb
 import polars as pl
 import streamlit as st
 
 DATA_DIR = Path(__file__).parent.parent / "data"
 PARQUET_PATH = DATA_DIR / "sales_enriched.parquet"
-YEARLY_CSV = DATA_DIR / "yearly.csv"
-SEGMENT_CSV = DATA_DIR / "segment_yearly.csv"
-REGION_CSV = DATA_DIR / "regional_revenue.csv"
-TOP_PRODUCTS_CSV = DATA_DIR / "top_products.csv"
+YEARLY_SPEC = DATA_DIR / "yearly.vl.json"
+SEGMENT_SPEC = DATA_DIR / "segment_yearly.vl.json"
+REGION_SPEC = DATA_DIR / "regional_revenue.vl.json"
+
+
+@st.cache_resource(show_spinner=False)
+def get_connection() -> duckdb.DuckDBPyConnection:
+    # Shared across reruns; with the metadata cache on, repeat reads of the same
+    # Parquet file skip re-parsing its footer.
+    conn = duckdb.connect()
+    conn.execute("SET parquet_metadata_cache = true")
+    return conn
 
 
 @st.cache_data(show_spinner=False)
-def load_dataset() -> pl.DataFrame:
+def load_kpis(mtime: float) -> tuple[int, float, int, int]:
     if not PARQUET_PATH.exists():
         raise FileNotFoundError(
             f"Missing {PARQUET_PATH}. Run `python3 src/etl.py` first."
         )
-    return pl.read_parquet(PARQUET_PATH)
+    # One DuckDB pass over the parquet file; only the three referenced columns are read.
+    with get_connection().cursor() as cursor:
+        return cursor.execute(
+            """
+            SELECT
+                COUNT(*),
+                SUM(sales),
+                COUNT(DISTINCT customer_id),
+                COUNT(DISTINCT product_id)
+            FROM read_parquet(?)
+            """,
+            [str(PARQUET_PATH)],
+        ).fetchone()
+
+
+@st.cache_data(show_spinner=False)
+def load_top_products(mtime: float, k: int = 15) -> pl.DataFrame:
+    # ORDER BY ... LIMIT lets DuckDB keep a bounded top-k heap instead of a full sort.
+    with get_connection().cursor() as cursor:
+        return cursor.execute(
+            """
+            SELECT
+                product_name,
+                ROUND(SUM(sales), 2) AS revenue,
+                COUNT(*) AS orders
+            FROM read_parquet(?)
+            GROUP BY product_name
+            ORDER BY revenue DESC
+            LIMIT ?
+            """,
+            [str(PARQUET_PATH), k],
+        ).pl()
 
 
 @st.cache_data(show_spinner=False)
-def load_summary(path: Path) -> pl.DataFrame | None:
+def load_chart_spec(path_str: str, mtime: float) -> dict | None:
+    # Specs are pre-built by the ETL with the aggregated rows inlined.
+    path = Path(path_str)
     if path.exists():
-        return pl.read_csv(path)
+        return json.loads(path.read_text())
     return None
 
 
+def file_mtime(path: Path) -> float:
+    return path.stat().st_mtime if path.exists() else 0.0
+
+
 def main() -> None:
     st.set_page_config(page_title="Smart Sales Analyzer", layout="wide")
     st.title("📊 Smart Sales Analyzer Dashboard")
     st.caption("Kaggle dataset augmented with 5000 locally generated synthetic rows.")
 
     try:
-        dataset = load_dataset()
+        total_rows, total_revenue, unique_customers, unique_products = load_kpis(
+            file_mtime(PARQUET_PATH)
+        )
     except FileNotFoundError as exc:
         st.error(str(exc))
         st.stop()
 
-    total_rows = len(dataset)
-    total_revenue = dataset["sales"].sum()
-    unique_customers = dataset["customer_id"].n_unique()
-    unique_products = dataset["product_id"].n_unique()
-
     col1, col2, col3, col4 = st.columns(4)
     col1.metric("Total Rows", f"{total_rows:,}")
     col2.metric("Total Revenue", f"${total_revenue:,.0f}")
     col3.metric("Unique Customers", f"{unique_customers:,}")
     col4.metric("Unique Products", f"{unique_products:,}")
 
-    yearly = load_summary(YEARLY_CSV)
-    segment = load_summary(SEGMENT_CSV)
-    regional = load_summary(REGION_CSV)
-    top_products = load_summary(TOP_PRODUCTS_CSV)
+    yearly_spec = load_chart_spec(str(YEARLY_SPEC), file_mtime(YEARLY_SPEC))
+    segment_spec = load_chart_spec(str(SEGMENT_SPEC), file_mtime(SEGMENT_SPEC))
+    regional_spec = load_chart_spec(str(REGION_SPEC), file_mtime(REGION_SPEC))
+    top_products = load_top_products(file_mtime(PARQUET_PATH))
 
     with st.container():
         st.subheader("Revenue by Year")
-        if yearly is not None and len(yearly) > 0:
-            chart = (
-                alt.Chart(yearly.to_pandas())
-                .mark_bar()
-                .encode(
-                    x=alt.X("order_year:O", title="Year"),
-                    y=alt.Y("revenue:Q", title="Revenue"),
-                    tooltip=["order_year", "rows", "revenue", "unique_customers"],
-                )
-                .properties(height=300)
-            )
-            st.altair_chart(chart, use_container_width=True)
+        if yearly_spec is not None and yearly_spec["data"]["values"]:
+            st.vega_lite_chart(yearly_spec, use_container_width=True)
         else:
             st.info("Run the ETL pipeline to populate this chart.")
 
@@ -80,43 +113,21 @@ def main() -> None:
 
     with left:
         st.subheader("Revenue by Segment and Year")
-        if segment is not None and len(segment) > 0:
-            chart = (
-                alt.Chart(segment.to_pandas())
-                .mark_circle(size=200)
-                .encode(
-                    x=alt.X("order_year:O", title="Year"),
-                    y=alt.Y("segment:N", title="Segment"),
-                    color=alt.Color("revenue:Q", scale=alt.Scale(scheme="blues")),
-                    size=alt.Size("revenue:Q", legend=None),
-                    tooltip=["order_year", "segment", "revenue"],
-                )
-                .properties(height=300)
-            )
-            st.altair_chart(chart, use_container_width=True)
+        if segment_spec is not None and segment_spec["data"]["values"]:
+            st.vega_lite_chart(segment_spec, use_container_width=True)
         else:
             st.info("Segment-level data unavailable.")
 
     with right:
         st.subheader("Top Regions by Revenue")
-        if regional is not None and len(regional) > 0:
-            chart = (
-                alt.Chart(regional.to_pandas())
-                .mark_bar()
-                .encode(
-                    x=alt.X("revenue:Q", title="Revenue"),
-                    y=alt.Y("region:N", sort="-x", title="Region"),
-                    tooltip=["region", "revenue"],
-                )
-                .properties(height=300)
-            )
-            st.altair_chart(chart, use_container_width=True)
+        if regional_spec is not None and regional_spec["data"]["values"]:
+            st.vega_lite_chart(regional_spec, use_container_width=True)
         else:
             st.info("Regional summary unavailable.")
 
     st.subheader("Top 15 Products")
-    if top_products is not None and len(top_products) > 0:
-        st.dataframe(top_products.sort("revenue", descending=True).head(15).to_pandas())
+    if len(top_products) > 0:
+        st.dataframe(top_products)
     else:
         st.info("Product-level summary unavailable.")
 
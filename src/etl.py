@@ -10,14 +10,6 @@ from pathlib import Path
 from typing import Dict, Optional
 import duckdb
 import polars as pl
-import kagglehub
-import great_expectations as ge
-from dotenv import load_dotenv
-from great_expectations.core.batch import Batch
-from great_expectations.core.batch_spec import RuntimeDataBatchSpec
-from great_expectations.core.expectation_suite import ExpectationSuite
-from great_expectations.execution_engine import PandasExecutionEngine
-from great_expectations.validator.validator import Validator
 
 from synthetic_data_generator import SyntheticDataGenerator
 
@@ -33,11 +25,47 @@ logger = logging.getLogger(__name__)
 class SalesETL:
     """Local ETL pipeline that enriches data and produces analytical summaries."""
 
-    def __init__(self, data_dir: str | Path = "data") -> None:
+    # Date layout used by the Kaggle sales-forecasting CSV (e.g. 08/11/2017).
+    BASE_DATE_FORMAT = "%d/%m/%Y"
+    # Leading rows read to check that layout before parsing the whole file.
+    DATE_SAMPLE_ROWS = 100
+    # Dtypes pinned when reading the base CSV instead of relying on inference.
+    BASE_SCHEMA_OVERRIDES = {"Sales": pl.Float64, "Postal Code": pl.Utf8}
+    # Low-cardinality labels stored as pl.Categorical after transform.
+    CATEGORICAL_COLUMNS = [
+        "ship_mode",
+        "segment",
+        "region",
+        "country",
+        "category",
+        "sub_category",
+    ]
+    # Transform expressions keyed by the (renamed) column they require; built once.
+    # Year/month repeat the Date cast; common-subexpression elimination evaluates it once.
+    _TRANSFORM_EXPRS: Dict[str, list[pl.Expr]] = {
+        "order_date": [
+            pl.col("order_date").cast(pl.Date),
+            pl.col("order_date").cast(pl.Date).dt.year().alias("order_year"),
+            pl.col("order_date").cast(pl.Date).dt.month().alias("order_month"),
+        ],
+        "ship_date": [pl.col("ship_date").cast(pl.Date)],
+        "sales": [pl.col("sales").cast(pl.Float64)],
+        "postal_code": [pl.col("postal_code").cast(pl.Utf8)],
+        # Dictionary-encode low-cardinality labels; Parquet writes them as dictionary pages.
+        **{col: [pl.col(col).cast(pl.Categorical)] for col in CATEGORICAL_COLUMNS},
+    }
+
+    def __init__(
+        self,
+        data_dir: str | Path = "data",
+        use_great_expectations: bool = False,
+    ) -> None:
         self.data_dir = Path(data_dir)
+        self.use_great_expectations = use_great_expectations
         self.data_dir.mkdir(parents=True, exist_ok=True)
         self.synthetic_generator = SyntheticDataGenerator()
         self.df: Optional[pl.DataFrame] = None
+        self.dataset_path = self.data_dir / "sales_enriched.parquet"
         self.warehouse_path = self.data_dir / "sales_analytics.duckdb"
         env_slug = os.getenv("KAGGLE_DATASET_SLUG")
         default_slugs = [
@@ -50,6 +78,78 @@ class SalesETL:
     # Data sourcing
     def load_base_dataset(self, csv_path: Optional[str | Path] = None) -> Optional[pl.DataFrame]:
         """Load the original dataset if it exists, otherwise return None."""
+        path = self._resolve_base_csv(csv_path)
+        if path is None:
+            logger.info("Base dataset not found; proceeding with fully synthetic data")
+            return None
+
+        logger.debug("Loading base dataset from %s", path)
+        self._clean_kaggle_csv(path)
+        # A small all-string sample gives the header and lets the date layout be checked.
+        sample = pl.scan_csv(path, n_rows=self.DATE_SAMPLE_ROWS, infer_schema=False).collect()
+        columns = sample.columns
+        # Build the cleanup as one lazy plan so the CSV is parsed in a single pass.
+        lf = pl.scan_csv(
+            path, try_parse_dates=False, schema_overrides=self.BASE_SCHEMA_OVERRIDES
+        )
+        # Drop unnamed/duplicate trailing columns left by malformed CSV headers.
+        drop_cols = [
+            col
+            for col in columns
+            if not col or not col.strip() or col.startswith("_duplicated_")
+        ]
+        if drop_cols:
+            lf = lf.drop(drop_cols)
+        essential_cols = [
+            col_name
+            for col_name in ["Order ID", "Customer ID", "Sales", "Order Date"]
+            if col_name in columns
+        ]
+        if essential_cols:
+            lf = lf.drop_nulls(subset=essential_cols)
+        date_cols = [col for col in ["Order Date", "Ship Date"] if col in columns]
+        date_format = None
+        if date_cols:
+            # Parse with the Kaggle layout when it fits; other files fall back to inference.
+            date_format = self._detect_date_format(sample, date_cols)
+            lf = lf.with_columns(pl.col(col).str.to_date(date_format) for col in date_cols)
+        try:
+            return lf.collect()
+        except (pl.exceptions.ComputeError, pl.exceptions.InvalidOperationError):
+            # Only pin the failure on a date column if that column fails on its own.
+            self._raise_for_unparseable_dates(path, date_cols, date_format)
+            raise
+
+    def _raise_for_unparseable_dates(
+        self, path: Path, date_cols: list[str], date_format: Optional[str]
+    ) -> None:
+        """Raise a ValueError naming the first date column that cannot be parsed."""
+        raw = pl.scan_csv(path, infer_schema=False)
+        for col in date_cols:
+            try:
+                raw.select(pl.col(col).str.to_date(date_format)).collect()
+            except (pl.exceptions.ComputeError, pl.exceptions.InvalidOperationError) as exc:
+                expected = date_format or "a layout Polars can infer (e.g. ISO 8601)"
+                raise ValueError(
+                    f"Could not parse {col} in {path}; expected {expected}."
+                ) from exc
+
+    def _detect_date_format(self, sample: pl.DataFrame, date_cols: list[str]) -> Optional[str]:
+        """Return BASE_DATE_FORMAT if it parses every sampled date, else None (infer)."""
+        for col in date_cols:
+            values = sample.get_column(col).drop_nulls()
+            parsed = values.str.to_date(self.BASE_DATE_FORMAT, strict=False)
+            if parsed.null_count() > 0:
+                logger.info(
+                    "%s does not match %s; inferring the date layout instead",
+                    col,
+                    self.BASE_DATE_FORMAT,
+                )
+                return None
+        return self.BASE_DATE_FORMAT
+
+    def _resolve_base_csv(self, csv_path: Optional[str | Path] = None) -> Optional[Path]:
+        """Return the first existing base CSV: ``csv_path`` first, then the data_dir defaults."""
         candidates = []
         if csv_path is not None:
             candidates.append(Path(csv_path))
@@ -63,31 +163,14 @@ class SalesETL:
 
         for path in candidates:
             if path.exists():
-                logger.debug("Loading base dataset from %s", path)
-                self._clean_kaggle_csv(path)
-                df = pl.read_csv(path, try_parse_dates=True)
-                # Drop unnamed/duplicate trailing columns left by malformed CSV headers.
-                drop_cols = [
-                    col
-                    for col in df.columns
-                    if not col or not col.strip() or col.startswith("_duplicated_")
-                ]
-                if drop_cols:
-                    df = df.drop(drop_cols)
-                essential_cols = [
-                    col_name
-                    for col_name in ["Order ID", "Customer ID", "Sales", "Order Date"]
-                    if col_name in df.columns
-                ]
-                if essential_cols:
-                    df = df.drop_nulls(subset=essential_cols)
-                return df
-
-        logger.info("Base dataset not found; proceeding with fully synthetic data")
+                return path
+
         return None
 
     def _setup_kaggle_credentials(self) -> None:
         """Load Kaggle credentials from .env (if present)."""
+        from dotenv import load_dotenv
+
         load_dotenv()
         username = os.getenv("KAGGLE_USERNAME")
         key = os.getenv("KAGGLE_KEY")
@@ -124,6 +207,9 @@ class SalesETL:
             logger.warning("No Kaggle dataset slug configured; skipping download.")
             return None
 
+        # Imported here so runs on a local CSV never pay for kagglehub's import chain.
+        import kagglehub
+
         for slug in slugs_to_try:
             try:
                 logger.info("Downloading dataset %s into %s", slug, self.data_dir)
@@ -150,7 +236,9 @@ class SalesETL:
 
             for csv_path in csv_candidates:
                 if csv_path.exists():
-                    shutil.copy2(csv_path, target_csv)
+                    # kagglehub may already have written train.csv into data_dir.
+                    if csv_path.resolve() != target_csv.resolve():
+                        shutil.copy2(csv_path, target_csv)
                     self._clean_kaggle_csv(target_csv)
                     logger.info("Dataset downloaded to %s via %s", target_csv, slug)
                     return target_csv
@@ -209,14 +297,36 @@ class SalesETL:
         self,
         base_df: Optional[pl.DataFrame],
         num_synthetic_rows: int = 5000,
+        target_rows: Optional[int] = None,
+        lazy: bool = False,
         **kwargs,
-    ) -> pl.DataFrame:
-        """Combine base data with synthetic rows (or generate synthetic from scratch)."""
+    ) -> pl.DataFrame | pl.LazyFrame:
+        """Combine base data with synthetic rows (or generate synthetic from scratch).
+
+        When ``target_rows`` is given, only the shortfall between the base data
+        and that size is generated, and generation is skipped entirely once the
+        base data already reaches it. With ``lazy=True`` a ``pl.LazyFrame`` is
+        returned on every path (``transform`` accepts either).
+        """
+        if target_rows is not None:
+            if target_rows <= 0:
+                raise ValueError(f"target_rows must be a positive integer, got {target_rows}")
+            base_rows = 0 if base_df is None else len(base_df)
+            if base_rows >= target_rows:
+                logger.info(
+                    "Base dataset (%s rows) already meets target of %s; skipping augmentation",
+                    base_rows,
+                    target_rows,
+                )
+                return base_df.lazy() if lazy else base_df
+            num_synthetic_rows = target_rows - base_rows
+
         if base_df is None or len(base_df) == 0:
             logger.info("Generating synthetic dataset with %s rows", num_synthetic_rows)
-            return self.synthetic_generator.generate_synthetic_data(
+            synthetic_df = self.synthetic_generator.generate_synthetic_data(
                 num_rows=num_synthetic_rows, **kwargs
             )
+            return synthetic_df.lazy() if lazy else synthetic_df
 
         logger.info(
             "Augmenting base dataset (%s rows) with %s synthetic rows",
@@ -224,75 +334,84 @@ class SalesETL:
             num_synthetic_rows,
         )
         return self.synthetic_generator.augment_dataframe(
-            base_df, num_synthetic_rows=num_synthetic_rows, **kwargs
+            base_df, num_synthetic_rows=num_synthetic_rows, lazy=lazy, **kwargs
         )
 
 
     # Transformations
 
-    def transform(self, df: pl.DataFrame) -> pl.DataFrame:
-        """Clean column names, enforce types, and derive analytical columns."""
+    def transform(self, df: pl.DataFrame | pl.LazyFrame) -> pl.LazyFrame:
+        """Clean column names, enforce types, and derive analytical columns (lazily)."""
+        lf = df.lazy()
         rename_map: Dict[str, str] = {
             col: col.strip().lower().replace(" ", "_").replace("-", "_")
-            for col in df.columns
+            for col in lf.collect_schema().names()
         }
-        transformed = df.rename(rename_map)
-
-        with_columns = []
-
-        if "order_date" in transformed.columns:
-            with_columns.append(pl.col("order_date").cast(pl.Date))
-            with_columns.append(pl.col("order_date").dt.year().alias("order_year"))
-            with_columns.append(pl.col("order_date").dt.month().alias("order_month"))
-
-        if "ship_date" in transformed.columns:
-            with_columns.append(pl.col("ship_date").cast(pl.Date))
-
-        if "sales" in transformed.columns:
-            with_columns.append(pl.col("sales").cast(pl.Float64))
-
-        if "postal_code" in transformed.columns:
-            with_columns.append(pl.col("postal_code").cast(pl.Utf8))
+        transformed = lf.rename(rename_map)
+        columns = set(rename_map.values())
+
+        with_columns = [
+            expr
+            for col, exprs in self._TRANSFORM_EXPRS.items()
+            if col in columns
+            for expr in exprs
+        ]
 
         if with_columns:
             transformed = transformed.with_columns(with_columns)
 
-        self.df = transformed
-        logger.debug("Transformed dataset with %s rows and %s columns", len(transformed), len(transformed.columns))
+        logger.debug("Planned transform over %s columns", len(columns))
         return transformed
 
     # Reporting
 
-    def build_summaries(self, df: pl.DataFrame) -> Dict[str, pl.DataFrame]:
-        """Create summary tables for analytics and reporting."""
-        summaries: Dict[str, pl.DataFrame] = {}
-
-        if "order_year" in df.columns:
+    def build_summaries(
+        self,
+        df: pl.DataFrame | pl.LazyFrame,
+        exact: bool = False,
+    ) -> Dict[str, pl.LazyFrame]:
+        """Plan summary tables for analytics and reporting (collected by the caller).
+
+        ``unique_customers`` uses a HyperLogLog estimate (~1% error) unless
+        ``exact`` is set, e.g. for reconciliation runs.
+        """
+        summaries: Dict[str, pl.LazyFrame] = {}
+        df = df.lazy()
+        columns = set(df.collect_schema().names())
+
+        if "order_year" in columns:
+            customer_id = pl.col("customer_id")
+            # The estimate can overshoot small groups, so cap it at the group's row count.
+            unique_customers = (
+                customer_id.n_unique()
+                if exact
+                else pl.min_horizontal(customer_id.approx_n_unique(), pl.len())
+            )
             summaries["yearly"] = (
                 df.group_by("order_year")
                 .agg(
                     pl.len().alias("rows"),
                     pl.col("sales").sum().round(2).alias("revenue"),
-                    pl.col("customer_id").n_unique().alias("unique_customers"),
+                    unique_customers.alias("unique_customers"),
                 )
                 .sort("order_year")
             )
 
-        if {"order_year", "segment"}.issubset(df.columns):
+        if {"order_year", "segment"}.issubset(columns):
             summaries["segment_yearly"] = (
                 df.group_by(["order_year", "segment"])
                 .agg(pl.col("sales").sum().round(2).alias("revenue"))
                 .sort(["order_year", "revenue"], descending=[False, True])
             )
 
-        if "region" in df.columns:
+        if "region" in columns:
             summaries["regional_revenue"] = (
                 df.group_by("region")
                 .agg(pl.col("sales").sum().round(2).alias("revenue"))
                 .sort("revenue", descending=True)
             )
 
-        if "product_name" in df.columns:
+        if "product_name" in columns:
             summaries["top_products"] = (
                 df.group_by("product_name")
                 .agg(
@@ -303,17 +422,118 @@ class SalesETL:
                 .head(15)
             )
 
-        logger.debug("Built %s summary tables", len(summaries))
+        logger.debug("Planned %s summary tables", len(summaries))
         return summaries
 
+    def build_chart_specs(self, summaries: Dict[str, pl.DataFrame]) -> Dict[str, dict]:
+        """Create Vega-Lite specs (with inlined rows) for the dashboard charts."""
+        specs: Dict[str, dict] = {}
+
+        if "yearly" in summaries:
+            specs["yearly"] = {
+                "data": {"values": summaries["yearly"].to_dicts()},
+                "mark": "bar",
+                "encoding": {
+                    "x": {"field": "order_year", "type": "ordinal", "title": "Year"},
+                    "y": {"field": "revenue", "type": "quantitative", "title": "Revenue"},
+                    "tooltip": [
+                        {"field": "order_year", "type": "ordinal"},
+                        {"field": "rows", "type": "quantitative"},
+                        {"field": "revenue", "type": "quantitative"},
+                        {"field": "unique_customers", "type": "quantitative"},
+                    ],
+                },
+                "height": 300,
+            }
+
+        if "segment_yearly" in summaries:
+            specs["segment_yearly"] = {
+                "data": {"values": summaries["segment_yearly"].to_dicts()},
+                "mark": {"type": "circle", "size": 200},
+                "encoding": {
+                    "x": {"field": "order_year", "type": "ordinal", "title": "Year"},
+                    "y": {"field": "segment", "type": "nominal", "title": "Segment"},
+                    "color": {
+                        "field": "revenue",
+                        "type": "quantitative",
+                        "scale": {"scheme": "blues"},
+                    },
+                    "size": {"field": "revenue", "type": "quantitative", "legend": None},
+                    "tooltip": [
+                        {"field": "order_year", "type": "ordinal"},
+                        {"field": "segment", "type": "nominal"},
+                        {"field": "revenue", "type": "quantitative"},
+                    ],
+                },
+                "height": 300,
+            }
+
+        if "regional_revenue" in summaries:
+            specs["regional_revenue"] = {
+                "data": {"values": summaries["regional_revenue"].to_dicts()},
+                "mark": "bar",
+                "encoding": {
+                    "x": {"field": "revenue", "type": "quantitative", "title": "Revenue"},
+                    "y": {"field": "region", "type": "nominal", "sort": "-x", "title": "Region"},
+                    "tooltip": [
+                        {"field": "region", "type": "nominal"},
+                        {"field": "revenue", "type": "quantitative"},
+                    ],
+                },
+                "height": 300,
+            }
+
+        logger.debug("Built %s chart specs", len(specs))
+        return specs
+
     def run_quality_checks(self, df: pl.DataFrame) -> Dict[str, bool]:
-        """Run lightweight Great Expectations checks on critical columns."""
+        """Run lightweight data quality checks on critical columns in one Polars pass."""
+        if self.use_great_expectations:
+            return self._run_quality_checks_ge(df)
+
+        checks = [
+            (pl.col(column).null_count() == 0).alias(f"{column}_not_null")
+            for column in ["order_id", "customer_id", "sales", "order_date"]
+            if column in df.columns
+        ]
+
+        if "sales" in df.columns:
+            checks.append((pl.col("sales") > 0).all().alias("sales_positive"))
+
+        if "order_year" in df.columns:
+            checks.append(
+                pl.col("order_year")
+                .is_between(pl.col("order_year").min(), pl.col("order_year").max())
+                .all()
+                .alias("order_year_valid_range")
+            )
+
+        expectations: Dict[str, bool] = {}
+        if checks:
+            expectations = {
+                name: bool(passed)
+                for name, passed in df.select(checks).row(0, named=True).items()
+            }
+
+        expectations["overall_success"] = all(expectations.values())
+        logger.info("Data quality checks success=%s", expectations["overall_success"])
+        return expectations
+
+    def _run_quality_checks_ge(self, df: pl.DataFrame) -> Dict[str, bool]:
+        """Run the same checks through Great Expectations (opt-in; slow to import)."""
+        import great_expectations as ge
+        from great_expectations.core.batch import Batch
+        from great_expectations.core.batch_spec import RuntimeDataBatchSpec
+        from great_expectations.core.expectation_suite import ExpectationSuite
+        from great_expectations.execution_engine import PandasExecutionEngine
+        from great_expectations.validator.validator import Validator
+
         pandas_df = df.to_pandas()
         context = ge.get_context()
         execution_engine = PandasExecutionEngine()
         execution_engine.data_context = context
 
-        batch_data = execution_engine.get_batch_data( 
+        batch_data = execution_engine.get_batch_data(
             RuntimeDataBatchSpec(batch_data=pandas_df)
         )
         batch = Batch(data=batch_data, data_context=context)
@@ -367,42 +587,60 @@ class SalesETL:
         df: pl.DataFrame,
         summaries: Dict[str, pl.DataFrame],
         quality_results: Dict[str, bool],
+        chart_specs: Optional[Dict[str, dict]] = None,
     ) -> None:
-        """Persist the dataset, summary tables, and quality report under the data directory."""
-        dataset_path = self.data_dir / "sales_enriched.parquet"
-        df.write_parquet(dataset_path)
-        logger.info("Saved enriched dataset to %s", dataset_path)
+        """Persist the dataset, summary tables, chart specs, and quality report under the data directory."""
+        # Clustering by year first keeps row-group min/max statistics tight for pruning,
+        # and the low-cardinality leading keys compress better once sorted.
+        sort_cols = [
+            col
+            for col in ["order_year", "segment", "customer_id", "product_id"]
+            if col in df.columns
+        ]
+        if sort_cols:
+            df = df.sort(sort_cols)
+        df.write_parquet(
+            self.dataset_path,
+            compression="zstd",
+            compression_level=3,
+            row_group_size=100_000,
+            statistics=True,
+        )
+        logger.info("Saved enriched dataset to %s", self.dataset_path)
 
         for name, table in summaries.items():
-            output_path = self.data_dir / f"{name}.csv"
-            table.write_csv(output_path)
+            output_path = self.data_dir / f"{name}.parquet"
+            table.write_parquet(output_path, compression="zstd", statistics=True)
             logger.info("Saved %s summary to %s", name, output_path)
 
+        for name, spec in (chart_specs or {}).items():
+            spec_path = self.data_dir / f"{name}.vl.json"
+            spec_path.write_text(json.dumps(spec))
+            logger.info("Saved %s chart spec to %s", name, spec_path)
+
         quality_path = self.data_dir / "quality_report.json"
         quality_path.write_text(json.dumps(quality_results, indent=2))
         logger.info("Saved data quality report to %s", quality_path)
 
-    def load_into_warehouse(
-        self,
-        df: pl.DataFrame,
-        summaries: Dict[str, pl.DataFrame],
-    ) -> None:
-        """Load datasets into DuckDB for interactive analytics."""
+    def load_into_warehouse(self, summaries: Dict[str, pl.DataFrame]) -> None:
+        """Load datasets into DuckDB for interactive analytics.
+
+        Tables are read back from the Parquet files written by
+        ``persist_outputs``, so that step must run first.
+        """
         with duckdb.connect(str(self.warehouse_path)) as conn:
             conn.execute("CREATE SCHEMA IF NOT EXISTS analytics")
-            conn.register("sales_dataset", df.to_arrow())
             conn.execute(
-                "CREATE OR REPLACE TABLE analytics.sales AS SELECT * FROM sales_dataset"
+                "CREATE OR REPLACE TABLE analytics.sales AS SELECT * FROM read_parquet(?)",
+                [str(self.dataset_path)],
             )
-            conn.unregister("sales_dataset")
 
-            for name, table in summaries.items():
+            for name in summaries:
                 view_name = f"{name}_summary"
-                conn.register(view_name, table.to_arrow())
                 conn.execute(
-                    f"CREATE OR REPLACE TABLE analytics.{view_name} AS SELECT * FROM {view_name}"
+                    f"CREATE OR REPLACE TABLE analytics.{view_name} AS SELECT * FROM read_parquet(?)",
+                    [str(self.data_dir / f"{name}.parquet")],
                 )
-                conn.unregister(view_name)
 
         logger.info("Persisted analytics tables into %s", self.warehouse_path)
 
@@ -421,11 +659,18 @@ class SalesETL:
 
         base_df = self.load_base_dataset(csv_candidate)
         combined_df = self.build_dataset(base_df, num_synthetic_rows=num_synthetic_rows, **kwargs)
-        transformed_df = self.transform(combined_df)
-        summaries = self.build_summaries(transformed_df)
+        transformed_lf = self.transform(combined_df)
+        summary_plans = self.build_summaries(transformed_lf)
+        # Collect everything together so Polars evaluates the shared transform only once.
+        transformed_df, *summary_tables = pl.collect_all(
+            [transformed_lf, *summary_plans.values()]
+        )
+        summaries = dict(zip(summary_plans, summary_tables))
+        self.df = transformed_df
+        chart_specs = self.build_chart_specs(summaries)
         quality_results = self.run_quality_checks(transformed_df)
-        self.persist_outputs(transformed_df, summaries, quality_results)
-        self.load_into_warehouse(transformed_df, summaries)
+        self.persist_outputs(transformed_df, summaries, quality_results, chart_specs)
+        self.load_into_warehouse(summaries)
 
         return transformed_df
 
@@ -1,15 +1,41 @@
 import logging
-import random
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
 from datetime import date, datetime, timedelta
+from pathlib import Path
 from typing import Optional, Sequence
 
 import numpy as np
 import polars as pl
 from faker import Faker
+from faker.providers.person import Provider as PersonProvider
 
 logger = logging.getLogger(__name__)
 
 
+def _generate_shard(
+    shard_seed: int,
+    shard_size: int,
+    locale: str,
+    product_names: pl.Series,
+    start_row_id: int,
+    options: dict,
+    output_path: Optional[str] = None,
+) -> pl.DataFrame | str:
+    """Build one shard of synthetic rows in a worker process (must stay picklable).
+
+    With ``output_path`` the shard is written to Parquet and only the path is
+    returned, so the rows never travel back to the parent process.
+    """
+    generator = SyntheticDataGenerator(seed=shard_seed, locale=locale)
+    shard = generator._generate_rows(shard_size, product_names, start_row_id, **options)
+    if output_path is None:
+        return shard
+    shard.write_parquet(output_path, compression="zstd", statistics=True)
+    return output_path
+
+
 class SyntheticDataGenerator:
     """Generate realistic synthetic sales data."""
 
@@ -59,28 +85,149 @@ class SyntheticDataGenerator:
         "Technology": {"Accessories", "Copiers", "Machines", "Phones"},
     }
 
+    # Explicit output schema so the DataFrame constructor skips type inference.
+    SYNTHETIC_SCHEMA = {
+        "Row ID": pl.Int64,
+        "Order ID": pl.Utf8,
+        "Order Date": pl.Date,
+        "Ship Date": pl.Date,
+        "Ship Mode": pl.Utf8,
+        "Customer ID": pl.Utf8,
+        "Customer Name": pl.Utf8,
+        "Segment": pl.Utf8,
+        "Country": pl.Utf8,
+        "City": pl.Utf8,
+        "State": pl.Utf8,
+        "Postal Code": pl.Utf8,
+        "Region": pl.Utf8,
+        "Category": pl.Utf8,
+        "Sub-Category": pl.Utf8,
+        "Product ID": pl.Utf8,
+        "Product Name": pl.Utf8,
+        "Sales": pl.Float64,
+    }
+    # Row counts above this are generated in shards across worker processes.
+    PARALLEL_ROW_THRESHOLD = 200_000
+    # Fixed shard size, so a given seed yields the same rows whatever the CPU count.
+    SHARD_ROWS = 100_000
+
     def __init__(self, seed: int = 42, locale: str = "en_US") -> None:
         """Initialize the synthetic data generator."""
 
         self.fake = Faker(locale)
-        Faker.seed(seed)
-        random.seed(seed)
-        np.random.seed(seed)
+        self.seed = seed
+        self.locale = locale
+        self.rng = np.random.default_rng(seed)
+        self._build_lookup_tables()
+        self._build_name_tables()
         logger.info("Initialized SyntheticDataGenerator with seed=%s", seed)
 
+    @classmethod
+    def _build_lookup_tables(cls) -> None:
+        """Flatten the reference lists and dicts into parallel, index-aligned columns.
+
+        The batched generator draws one integer index per row and gathers every
+        related field from these tables, instead of walking the nested dicts.
+        Built once per class (subclasses overriding the dicts get their own).
+        """
+        if "_city_names" in cls.__dict__:
+            return
+
+        cls._ship_modes = pl.Series(cls.SHIP_MODES, dtype=pl.Utf8)
+        cls._segments = pl.Series(cls.SEGMENTS, dtype=pl.Utf8)
+        city_infos = list(cls.US_CITIES.values())
+        cls._city_names = pl.Series(list(cls.US_CITIES))
+        cls._city_states = pl.Series([info["state"] for info in city_infos])
+        cls._city_zip_prefixes = pl.Series([info["zip_prefix"] for info in city_infos])
+        cls._city_regions = pl.Series([info["region"] for info in city_infos])
+
+        # Sub-categories are sorted so a given seed always maps to the same values.
+        category_names = list(cls.CATEGORIES)
+        subcategory_lists = [sorted(cls.CATEGORIES[c]) for c in category_names]
+        flat_pairs = [
+            (category, sub)
+            for category, subs in zip(category_names, subcategory_lists)
+            for sub in subs
+        ]
+        cls._subcategory_counts = np.array([len(subs) for subs in subcategory_lists])
+        cls._subcategory_offsets = np.concatenate(
+            ([0], np.cumsum(cls._subcategory_counts)[:-1])
+        )
+        cls._flat_categories = pl.Series([category for category, _ in flat_pairs])
+        cls._flat_subcategories = pl.Series([sub for _, sub in flat_pairs])
+        cls._product_prefixes = pl.Series(
+            [f"{category[:3].upper()}-{sub[:2].upper()}" for category, sub in flat_pairs]
+        )
+
+        # Tuples for the per-row helpers, so a choice does not rebuild a list per call.
+        cls._city_keys = tuple(cls.US_CITIES)
+        cls._category_keys = tuple(category_names)
+        cls._subcats = {
+            category: tuple(subs)
+            for category, subs in zip(category_names, subcategory_lists)
+        }
+
+    def _randint(self, low: int, high: int) -> int:
+        """Draw one integer in ``[low, high]`` (inclusive, like ``random.randint``)."""
+        return int(self.rng.integers(low, high + 1))
+
+    def _choice(self, options: Sequence[str]) -> str:
+        """Pick one element of ``options`` using the generator's shared RNG stream."""
+        return options[self.rng.integers(len(options))]
+
+    def _build_name_tables(self) -> None:
+        """Load first/last names (and frequency weights) from the locale's person provider.
+
+        Names are then drawn with ``self.rng`` by index, which skips Faker's
+        per-call provider lookup and format parsing.
+        """
+        provider = next(
+            p for p in self.fake.get_providers() if isinstance(p, PersonProvider)
+        )
+
+        def names_and_weights(names) -> tuple[pl.Series, Optional[np.ndarray]]:
+            # Providers store either weighted OrderedDicts or plain tuples.
+            weights = None
+            if isinstance(names, dict):
+                weights = np.fromiter(names.values(), dtype=np.float64)
+                weights /= weights.sum()
+            return pl.Series(list(names), dtype=pl.Utf8), weights
+
+        self._first_names, self._first_name_weights = names_and_weights(
+            provider.first_names
+        )
+        self._last_names, self._last_name_weights = names_and_weights(provider.last_names)
+
+    def _draw_name_indices(self, size: int) -> tuple[np.ndarray, np.ndarray]:
+        """Draw weighted first- and last-name indices for ``size`` customers."""
+        first_idx = self.rng.choice(
+            len(self._first_names), size=size, p=self._first_name_weights
+        )
+        last_idx = self.rng.choice(
+            len(self._last_names), size=size, p=self._last_name_weights
+        )
+        return first_idx, last_idx
+
     def generate_customer_name(self) -> str:
-        """Generate a customer name for the United States locale."""
-        return self.fake.name()
+        """Generate a customer name for the configured locale."""
+        first_idx, last_idx = self._draw_name_indices(1)
+        first_name = self._first_names[int(first_idx[0])]
+        return f"{first_name} {self._last_names[int(last_idx[0])]}"
 
-    def generate_customer_id(self, customer_name: str) -> str:
-        """Generate a customer identifier (e.g. CG-12456)."""
+    @staticmethod
+    def _customer_initials(customer_name: str) -> str:
+        """Return the two upper-case initials used in customer identifiers."""
         parts = customer_name.split()
         if len(parts) < 2:
             initials = (parts[0][0] if parts else "X") + "X"
         else:
             initials = parts[0][0] + parts[1][0]
-        number = random.randint(10000, 99999)
-        return f"{initials.upper()}-{number}"
+        return initials.upper()
+
+    def generate_customer_id(self, customer_name: str) -> str:
+        """Generate a customer identifier (e.g. CG-12456)."""
+        number = self._randint(10000, 99999)
+        return f"{self._customer_initials(customer_name)}-{number}"
 
     def generate_order_dates(
         self,
@@ -90,18 +237,16 @@ class SyntheticDataGenerator:
         max_ship_days: int = 14,
     ) -> tuple[date, date]:
         """Generate order and ship dates (ship date after order date)."""
-        order_date = self.fake.date_between(start_date=start_date, end_date=end_date)
-        ship_date = self.fake.date_between(
-            start_date=order_date + timedelta(days=min_ship_days),
-            end_date=order_date + timedelta(days=max_ship_days),
-        )
+        # Integer day offsets (both bounds inclusive) instead of Faker's datetime round trips.
+        order_date = start_date + timedelta(days=self._randint(0, (end_date - start_date).days))
+        ship_date = order_date + timedelta(days=self._randint(min_ship_days, max_ship_days))
         return order_date, ship_date
 
     def generate_location_data(self) -> dict[str, str]:
         """Generate city, state, postal code and region."""
-        city = random.choice(list(self.US_CITIES))
+        city = self._choice(self._city_keys)
         city_info = self.US_CITIES[city]
-        postal_code = f"{city_info['zip_prefix']}{random.randint(10, 99)}"
+        postal_code = f"{city_info['zip_prefix']}{self._randint(10, 99)}"
         return {
             "City": city,
             "State": city_info["state"],
@@ -111,28 +256,28 @@ class SyntheticDataGenerator:
 
     def generate_categories(self) -> dict[str, str]:
         """Generate category and sub-category by random choice."""
-        category = random.choice(list(self.CATEGORIES))
-        sub_category = random.choice(list(self.CATEGORIES[category]))
+        category = self._choice(self._category_keys)
+        sub_category = self._choice(self._subcats[category])
         return {"Category": category, "Sub-Category": sub_category}
 
     def generate_order_id(self, order_date: datetime) -> str:
         """Generate an order identifier (e.g. US-2016-118983)."""
-        return f"US-{order_date.year}-{random.randint(100000, 999999)}"
+        return f"US-{order_date.year}-{self._randint(100000, 999999)}"
 
     def generate_sales_amount(self, min_amount: int = 20, max_amount: int = 2000) -> float:
         """Generate a sales amount within the provided range."""
-        return float(random.randint(min_amount, max_amount))
+        return float(self._randint(min_amount, max_amount))
 
     def generate_product_id(self, category: str, subcategory: str) -> str:
         """Generate a product identifier based on category and sub-category."""
         cat_abbr = category[:3].upper()
         sub_abbr = subcategory[:2].upper()
-        return f"{cat_abbr}-{sub_abbr}-100{random.randint(10000, 99999)}"
+        return f"{cat_abbr}-{sub_abbr}-100{self._randint(10000, 99999)}"
 
     def _fallback_products(self) -> Sequence[str]:
         """Fallback list of synthetic product names."""
         products = []
-        for category, subcategories in self.CATEGORIES.items():
+        for category, subcategories in self._subcats.items():
             for sub in subcategories:
                 products.append(f"{category} - {sub}")
         return products
@@ -143,22 +288,94 @@ class SyntheticDataGenerator:
         num_rows: int = 10_000,
         start_date: date = date(2020, 1, 1),
         end_date: date = date(2024, 12, 31),
+        min_ship_days: int = 1,
+        max_ship_days: int = 14,
     ) -> pl.DataFrame:
         """Generate synthetic sales records."""
 
         logger.info("Generating %s synthetic rows...", num_rows)
 
-        product_names: Sequence[str] = []
+        product_names, start_row_id = self._sampling_inputs(original_df)
+        options = self._row_options(start_date, end_date, min_ship_days, max_ship_days)
+        if num_rows > self.PARALLEL_ROW_THRESHOLD:
+            shards = self._run_shards(
+                num_rows, self.SHARD_ROWS, product_names, start_row_id, options
+            )
+            synthetic_df = pl.concat(shards, rechunk=False)
+        else:
+            synthetic_df = self._generate_rows(
+                num_rows, product_names, start_row_id, **options
+            )
+        logger.info("Successfully generated %s synthetic rows", len(synthetic_df))
+        return synthetic_df
+
+    def write_synthetic_shards(
+        self,
+        output_dir: str | Path,
+        original_df: Optional[pl.DataFrame] = None,
+        num_rows: int = 10_000,
+        shard_rows: int = SHARD_ROWS,
+        overwrite: bool = False,
+        start_date: date = date(2020, 1, 1),
+        end_date: date = date(2024, 12, 31),
+        min_ship_days: int = 1,
+        max_ship_days: int = 14,
+    ) -> list[Path]:
+        """Generate synthetic records shard by shard, writing each to Parquet.
+
+        At most one shard per worker is held in memory. Read the result back
+        lazily with ``pl.scan_parquet(output_dir / "shard_*.parquet")``. A
+        non-empty ``output_dir`` is refused unless ``overwrite`` is set, in
+        which case existing ``shard_*.parquet`` files are replaced.
+        """
+        if shard_rows <= 0:
+            raise ValueError(f"shard_rows must be a positive integer, got {shard_rows}")
+
+        output_dir = Path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        if any(output_dir.iterdir()):
+            if not overwrite:
+                raise FileExistsError(
+                    f"{output_dir} is not empty; pass overwrite=True to replace its shards."
+                )
+            # Remove shards left by an earlier, larger run so the glob only sees this one.
+            for stale in output_dir.glob("shard_*.parquet"):
+                stale.unlink()
+
+        product_names, start_row_id = self._sampling_inputs(original_df)
+        options = self._row_options(start_date, end_date, min_ship_days, max_ship_days)
+        logger.info("Writing %s synthetic rows as Parquet shards to %s", num_rows, output_dir)
+        written = self._run_shards(
+            num_rows, shard_rows, product_names, start_row_id, options, output_dir
+        )
+        return [Path(path) for path in written]
+
+    @staticmethod
+    def _row_options(
+        start_date: date, end_date: date, min_ship_days: int, max_ship_days: int
+    ) -> dict:
+        """Bundle the date settings ``_generate_rows`` takes (picklable for workers)."""
+        return {
+            "start_date": start_date,
+            "end_date": end_date,
+            "min_ship_days": min_ship_days,
+            "max_ship_days": max_ship_days,
+        }
+
+    def _sampling_inputs(self, original_df: Optional[pl.DataFrame]) -> tuple[pl.Series, int]:
+        """Return the product names to sample and the first synthetic Row ID."""
+        product_names = pl.Series("Product Name", [], dtype=pl.Utf8)
         start_row_id = 1
 
         if original_df is not None and len(original_df) > 0:
             if "Product Name" in original_df.columns:
                 try:
+                    # Keep first-seen order so a given seed samples the same names every run.
                     product_names = (
-                        original_df.select("Product Name")
-                        .unique()
-                        ["Product Name"]
-                        .to_list()
+                        original_df.get_column("Product Name")
+                        .cast(pl.Utf8)
+                        .drop_nulls()
+                        .unique(maintain_order=True)
                     )
                 except Exception as exc:  # pragma: no cover - defensive
                     logger.warning("Could not extract product names: %s", exc)
@@ -170,63 +387,182 @@ class SyntheticDataGenerator:
                 except Exception as exc:  # pragma: no cover - defensive
                     logger.warning("Could not determine starting Row ID: %s", exc)
 
-        if not product_names:
-            product_names = self._fallback_products()
+        if len(product_names) == 0:
+            product_names = pl.Series("Product Name", self._fallback_products(), dtype=pl.Utf8)
+        return product_names, start_row_id
 
-        synthetic_rows = []
+    @staticmethod
+    def _shard_plan(
+        num_rows: int, num_shards: int, start_row_id: int
+    ) -> tuple[list[int], list[int]]:
+        """Split ``num_rows`` into near-equal shards with contiguous Row ID ranges."""
+        base_size, remainder = divmod(num_rows, num_shards)
+        shard_sizes = [base_size + (i < remainder) for i in range(num_shards)]
+        shard_starts = [start_row_id + sum(shard_sizes[:i]) for i in range(num_shards)]
+        return shard_sizes, shard_starts
 
-        for i in range(num_rows):
-            customer_name = self.generate_customer_name()
-            customer_id = self.generate_customer_id(customer_name)
-            order_date, ship_date = self.generate_order_dates(
-                start_date=start_date, end_date=end_date
-            )
-            order_id = self.generate_order_id(order_date)
-            location = self.generate_location_data()
-            categories = self.generate_categories()
-            product_id = self.generate_product_id(
-                categories["Category"], categories["Sub-Category"]
-            )
-            product_name = random.choice(product_names)
-            sales = self.generate_sales_amount(min_amount=10, max_amount=2900)
-
-            row = {
-                "Row ID": start_row_id + i,
-                "Order ID": order_id,
-                "Order Date": order_date,
-                "Ship Date": ship_date,
-                "Ship Mode": random.choice(self.SHIP_MODES),
-                "Customer ID": customer_id,
-                "Customer Name": customer_name,
-                "Segment": random.choice(self.SEGMENTS),
-                "Country": "United States",
-                "City": location["City"],
-                "State": location["State"],
-                "Postal Code": location["Postal Code"],
-                "Region": location["Region"],
-                "Category": categories["Category"],
-                "Sub-Category": categories["Sub-Category"],
-                "Product ID": product_id,
-                "Product Name": product_name,
-                "Sales": sales,
-            }
-            synthetic_rows.append(row)
-
-        synthetic_df = pl.DataFrame(synthetic_rows)
-        logger.info("Successfully generated %s synthetic rows", len(synthetic_df))
-        return synthetic_df
+    def _run_shards(
+        self,
+        num_rows: int,
+        shard_rows: int,
+        product_names: pl.Series,
+        start_row_id: int,
+        options: dict,
+        output_dir: Optional[Path] = None,
+    ) -> list[pl.DataFrame] | list[str]:
+        """Generate ``num_rows`` in fixed-size shards, across processes when CPUs allow.
+
+        Shard seeds are drawn from ``self.rng``, so repeated calls give new rows
+        while a given seed gives the same rows on any machine. With
+        ``output_dir`` each shard is written there and its path returned.
+        """
+        num_shards = max(1, -(-num_rows // shard_rows))
+        shard_sizes, shard_starts = self._shard_plan(num_rows, num_shards, start_row_id)
+        shard_seeds = [int(seed) for seed in self.rng.integers(2**63, size=num_shards)]
+        output_paths = [
+            None if output_dir is None else str(output_dir / f"shard_{shard_id:04d}.parquet")
+            for shard_id in range(num_shards)
+        ]
+        shard_args = (
+            shard_seeds,
+            shard_sizes,
+            [self.locale] * num_shards,
+            [product_names] * num_shards,
+            shard_starts,
+            [options] * num_shards,
+            output_paths,
+        )
+        num_workers = min(os.cpu_count() or 1, num_shards)
+        logger.info(
+            "Generating %s synthetic rows in %s shards across %s processes",
+            num_rows,
+            num_shards,
+            num_workers,
+        )
+
+        if num_workers == 1:
+            return list(map(_generate_shard, *shard_args))
+        # Spawn rather than fork: forking after Polars has started its thread pool can deadlock.
+        with ProcessPoolExecutor(
+            max_workers=num_workers, mp_context=multiprocessing.get_context("spawn")
+        ) as executor:
+            return list(executor.map(_generate_shard, *shard_args))
+
+    def _generate_rows(
+        self,
+        num_rows: int,
+        product_names: pl.Series,
+        start_row_id: int,
+        start_date: date,
+        end_date: date,
+        min_ship_days: int,
+        max_ship_days: int,
+    ) -> pl.DataFrame:
+        """Build ``num_rows`` synthetic records with vectorised draws from ``self.rng``."""
+        # Draw every column in bulk instead of looping row by row.
+        rng = self.rng
+
+        city_idx = rng.integers(0, len(self._city_names), size=num_rows)
+        cities = self._city_names.gather(city_idx)
+        states = self._city_states.gather(city_idx)
+        regions = self._city_regions.gather(city_idx)
+        postal_codes = self._city_zip_prefixes.gather(city_idx) + pl.Series(
+            rng.integers(10, 100, size=num_rows)
+        ).cast(pl.Utf8)
+
+        # Pick a category uniformly, then a sub-category uniformly within it.
+        category_idx = rng.integers(0, len(self._subcategory_counts), size=num_rows)
+        flat_idx = self._subcategory_offsets[category_idx] + (
+            rng.random(num_rows) * self._subcategory_counts[category_idx]
+        ).astype(np.int64)
+        categories = self._flat_categories.gather(flat_idx)
+        subcategories = self._flat_subcategories.gather(flat_idx)
+        product_prefixes = self._product_prefixes.gather(flat_idx)
+        # String IDs are concatenated column-wise from pre-drawn integers.
+        product_ids = (
+            product_prefixes
+            + "-100"
+            + pl.Series(rng.integers(10000, 100000, size=num_rows)).cast(pl.Utf8)
+        )
+
+        # Dates are integer day offsets (both bounds inclusive, as with Faker.date_between).
+        order_offsets = rng.integers(
+            0, (end_date - start_date).days + 1, size=num_rows, dtype=np.int32
+        )
+        ship_offsets = rng.integers(
+            min_ship_days, max_ship_days + 1, size=num_rows, dtype=np.int32
+        )
+        order_dates = np.datetime64(start_date, "D") + order_offsets.astype("timedelta64[D]")
+        ship_dates = order_dates + ship_offsets.astype("timedelta64[D]")
+        order_years = order_dates.astype("datetime64[Y]").astype(np.int64) + 1970
+        order_ids = (
+            "US-"
+            + pl.Series(order_years).cast(pl.Utf8)
+            + "-"
+            + pl.Series(rng.integers(100000, 1_000_000, size=num_rows)).cast(pl.Utf8)
+        )
+
+        # Names are gathered from the provider's first/last lists; no Faker call per row.
+        first_idx, last_idx = self._draw_name_indices(num_rows)
+        first_names = self._first_names.gather(first_idx)
+        last_names = self._last_names.gather(last_idx)
+        customer_names = first_names + " " + last_names
+        customer_ids = (
+            first_names.str.slice(0, 1).str.to_uppercase()
+            + last_names.str.slice(0, 1).str.to_uppercase()
+            + "-"
+            + pl.Series(rng.integers(10000, 100000, size=num_rows)).cast(pl.Utf8)
+        )
+
+        return pl.DataFrame(
+            {
+                "Row ID": np.arange(start_row_id, start_row_id + num_rows),
+                "Order ID": order_ids,
+                "Order Date": order_dates,
+                "Ship Date": ship_dates,
+                "Ship Mode": self._ship_modes.gather(
+                    rng.integers(0, len(self._ship_modes), size=num_rows)
+                ),
+                "Customer ID": customer_ids,
+                "Customer Name": customer_names,
+                "Segment": self._segments.gather(
+                    rng.integers(0, len(self._segments), size=num_rows)
+                ),
+                "Country": pl.repeat("United States", num_rows, eager=True),
+                "City": cities,
+                "State": states,
+                "Postal Code": postal_codes,
+                "Region": regions,
+                "Category": categories,
+                "Sub-Category": subcategories,
+                "Product ID": product_ids,
+                "Product Name": product_names.gather(
+                    rng.integers(0, len(product_names), size=num_rows)
+                ),
+                "Sales": rng.integers(10, 2901, size=num_rows).astype(np.float64),
+            },
+            schema=self.SYNTHETIC_SCHEMA,
+        )
 
     def augment_dataframe(
         self,
         original_df: pl.DataFrame,
         num_synthetic_rows: int = 10_000,
+        lazy: bool = False,
         **kwargs,
-    ) -> pl.DataFrame:
-        """Augment an existing sales dataframe with synthetic rows."""
+    ) -> pl.DataFrame | pl.LazyFrame:
+        """Augment an existing sales dataframe with synthetic rows.
+
+        With ``lazy=True`` the schema alignment and the union are returned as a
+        ``pl.LazyFrame`` plan, so downstream projections/filters are pushed into
+        both inputs; the caller must ``collect()`` it (e.g. ``engine="streaming"``).
+        """
 
         synthetic_df = self.generate_synthetic_data(
             original_df, num_rows=num_synthetic_rows, **kwargs
         )
+        synthetic_rows = len(synthetic_df)
+        synthetic: pl.DataFrame | pl.LazyFrame = synthetic_df.lazy() if lazy else synthetic_df
         if original_df is not None and len(original_df) > 0:
             schema = original_df.schema
             aligned_columns = []
@@ -239,13 +575,19 @@ class SyntheticDataGenerator:
                     aligned_columns.append(
                         pl.lit(None).cast(dtype).alias(column_name)
                     )
-            synthetic_df = synthetic_df.select(aligned_columns)
+            synthetic = synthetic.select(aligned_columns)
 
-        combined_df = pl.concat([original_df, synthetic_df])
+        # Skip the eager rechunk: the lazy transform and group_bys consume chunked input,
+        # and the sort before the parquet write produces contiguous columns anyway.
+        combined = pl.concat(
+            [original_df.lazy() if lazy else original_df, synthetic],
+            how="vertical_relaxed",
+            rechunk=False,
+        )
         logger.info(
             "Augmented data: %s original + %s synthetic = %s total rows",
             len(original_df),
-            len(synthetic_df),
-            len(combined_df),
+            synthetic_rows,
+            len(original_df) + synthetic_rows,
         )
-        return combined_df
+        return combined